@@ -84,20 +84,19 @@ def main():
         if not os.path.isfile(value):
             print(f"Unable to find the {key} csv at {value}")
             return
+    loader = cibc.CIBCStatementLoader()
+    try:
+        savings_df = loader.load(csv_paths["savings"])
+        chequing_df = loader.load(csv_paths["chequing"])
+        credit_df = loader.load(csv_paths["credit"])
+    except cibc.StatementValidationError as e:
+        print(e)
+        return
     presenter = Presenter(
         processor=cibc.CIBCProcessor(
-            savings_df=pd.read_csv(
-                csv_paths["savings"],
-                names=["date", "description", "debit", "credit"]
-            ),
-            chequing_df=pd.read_csv(
-                csv_paths["chequing"],
-                names=["date", "description", "debit", "credit"]
-            ),
-            credit_df=pd.read_csv(
-                csv_paths["credit"], usecols=range(0, 4),
-                names=["date", "description", "debit", "credit"]
-            )
+            savings_df=savings_df,
+            chequing_df=chequing_df,
+            credit_df=credit_df
         )
     )
     if args.create:
@@ -1,6 +1,9 @@
 import re
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import string
 
 
@@ -30,6 +33,97 @@ class CIBCTransactionDescription:
         return pd.Series(attributes)
 
 
+class StatementValidationError(Exception):
+    pass
+
+
+class CIBCStatementLoader:
+    # statements are exported without a header row; the credit card statement
+    # has an extra card number column after these, which is skipped at read time
+    SCHEMA = pa.schema([
+        ("date", pa.date32()),
+        ("description", pa.string()),
+        ("debit", pa.float64()),
+        ("credit", pa.float64())
+    ])
+    DATE_FORMAT = "%Y-%m-%d"
+    AMOUNT_PATTERN = r"^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)$"
+
+    def load(self, csv_path):
+        table = self._validate(csv_path, self._read_table(csv_path))
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _read_table(self, csv_path):
+        # the number of columns differs between accounts, so read with generated
+        # column names (f0, f1, ...) and only keep the leading columns; every
+        # column is read as a string so bad values can be reported per row
+        generated_names = [f"f{i}" for i in range(0, len(self.SCHEMA))]
+        try:
+            table = pa_csv.read_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in generated_names},
+                    include_columns=generated_names,
+                    strings_can_be_null=True
+                )
+            )
+        except KeyError as e:
+            raise StatementValidationError(
+                f"Unable to read {csv_path}: expected at least {len(self.SCHEMA)} columns"
+            ) from e
+        except pa.ArrowInvalid as e:
+            raise StatementValidationError(f"Unable to read {csv_path}: {e}") from e
+        return table.rename_columns(self.SCHEMA.names)
+
+    def _validate(self, csv_path, table):
+        raw_date = table.column("date")
+        date = pc.strptime(raw_date, format=self.DATE_FORMAT, unit="s", error_is_null=True)
+        checks = [
+            ("missing date", pc.is_null(raw_date), None),
+            ("invalid date", pc.and_(pc.is_valid(raw_date), pc.is_null(date)), raw_date),
+            ("missing description", pc.is_null(table.column("description")), None)
+        ]
+        amounts = {}
+        for column in ["debit", "credit"]:
+            raw_amount = table.column(column)
+            is_amount = pc.match_substring_regex(raw_amount, self.AMOUNT_PATTERN)
+            checks.append((f"invalid {column}", pc.invert(pc.fill_null(is_amount, True)), raw_amount))
+            amounts[column] = pc.cast(
+                pc.if_else(is_amount, raw_amount, pa.scalar(None, pa.string())),
+                pa.float64()
+            )
+        # each row is either a debit or a credit
+        checks.append((
+            "expected exactly one of debit or credit",
+            pc.equal(pc.is_null(table.column("debit")), pc.is_null(table.column("credit"))),
+            None
+        ))
+        invalid = checks[0][1]
+        for _, mask, _ in checks[1:]:
+            invalid = pc.or_(invalid, mask)
+        if pc.any(invalid).as_py():
+            errors = []
+            for i in pc.indices_nonzero(invalid).to_pylist():
+                row_errors = []
+                for message, mask, values in checks:
+                    if not mask[i].as_py():
+                        continue
+                    if values is not None:
+                        message = f"{message} '{values[i].as_py()}'"
+                    row_errors.append(message)
+                errors.append(f"row {i + 1}: {', '.join(row_errors)}")
+            raise StatementValidationError(
+                f"Invalid rows in {csv_path}:\n" + "\n".join(errors)
+            )
+        return pa.table([
+            pc.cast(date, pa.date32()),
+            table.column("description"),
+            amounts["debit"],
+            amounts["credit"]
+        ], schema=self.SCHEMA)
+
+
 class CIBCProcessor:
     def __init__(
             self,
@@ -137,8 +231,7 @@ class CIBCProcessor:
         df["month"] = date.dt.month
         df["day"] = date.dt.day
         df["account"] = account
-        df["amount"] = df[["debit", "credit"]].apply(
-            lambda x: x["credit"] if pd.isnull(x["debit"]) else -1 * x["debit"], axis=1)
+        df["amount"] = df["credit"].fillna(-df["debit"])
         df = df.drop(columns=["debit", "credit"])
         if expand_fn:
             expand_fn(df)